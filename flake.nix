@@ -38,6 +38,8 @@
                 enable = true;
                 requirements = ''
                   omegaconf
+                  orjson
+                  pyudev
                 '';
               };
             };
@@ -3,12 +3,26 @@
 Gigarandr - A script to manage monitor configurations using xrandr.
 """
 
+import argparse
+import re
+import shlex
+import shutil
+import signal
 import sys
 import subprocess
 import json
+import os
 import logging
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Iterable, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logging.basicConfig(
@@ -20,10 +34,62 @@ logging.basicConfig(
 CONFIG_DIR = Path.home() / '.config' / 'gigarandr'
 CONFIG_FILE = CONFIG_DIR / 'config.json'
 STATE_FILE = CONFIG_DIR / 'monitor_state.json'
+# Plain string paths for the hot read/write paths, avoiding Path overhead
+CONFIG_FILE_STR = str(CONFIG_FILE)
+STATE_FILE_STR = str(STATE_FILE)
 
 # Monitor keywords
 MONITOR_KEYWORDS = {'laptop', 'largest', 'smallest'}
 
+# Output name prefixes of built-in laptop panels
+_LAPTOP_PREFIXES = ('eDP', 'LVDS', 'DSI')
+
+# Seconds to wait for a burst of udev events to settle in daemon mode
+DAEMON_SETTLE_SECONDS = 0.5
+
+# Refresh rates closer than this are the same xrandr mode, e.g. 59.94 and 60.00 are not
+_RATE_TOLERANCE = 0.01
+
+# Characters that make a hook command require `/bin/sh`
+SHELL_METACHARACTERS = set('|&;<>()$`\\*?[]{}~!#\n')
+
+# Signals ignored by Python that spawned hook commands should get back
+_RESTORED_SIGNALS = tuple(
+    getattr(signal, name) for name in ('SIGPIPE', 'SIGXFSZ') if hasattr(signal, name)
+)
+
+# A hook command and its pre-split argv, or None if it must run through the shell
+HookCommand = Tuple[str, Optional[List[str]]]
+
+# Current geometry of an active output, e.g. `1920x1080+0+0`
+_GEOMETRY_RE = re.compile(rb'\b(\d+)x(\d+)\+(\d+)\+(\d+)\b')
+
+# Resolution part of a mode name, e.g. `1920x1080i`
+_RESOLUTION_RE = re.compile(r'(\d+)x(\d+)')
+
+# Stdlib JSON codec instances reused when orjson is not installed
+_DECODER = json.JSONDecoder()
+_ENCODER = json.JSONEncoder(indent=2)
+_COMPACT_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+
+class GigarandrError(Exception):
+    """Raised when monitors cannot be configured, e.g. because xrandr failed."""
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return _DECODER.decode(data.decode('utf-8'))
+
+
+def _json_dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize JSON, indented for humans or compact, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return (_ENCODER if indent else _COMPACT_ENCODER).encode(obj).encode('utf-8')
+
 
 def ensure_config_directory() -> None:
     """Ensure the configuration directory and files exist."""
@@ -47,31 +113,40 @@ def ensure_config_directory() -> None:
         }
     }
     if not CONFIG_FILE.exists():
-        with CONFIG_FILE.open('w') as f:
-            json.dump(default_config, f, indent=4)
+        CONFIG_FILE.write_bytes(_json_dumps(default_config))
     if not STATE_FILE.exists():
-        with STATE_FILE.open('w') as f:
-            json.dump({}, f, indent=4)
+        STATE_FILE.write_bytes(_json_dumps({}, indent=False))
+
+
+@lru_cache(maxsize=1)
+def _load_config_cached(mtime_ns: int) -> Dict[str, Any]:
+    """Read and parse the configuration file; cached on its modification time."""
+    with open(CONFIG_FILE_STR, 'rb') as f:
+        return _json_loads(f.read())
 
 
 def load_config() -> Dict[str, Any]:
-    """Load the configuration file."""
+    """
+    Load the configuration file.
+
+    The parsed configuration is reused until the file's modification time changes.
+
+    Raises:
+        GigarandrError: If the file is missing or is not valid JSON.
+    """
     try:
-        with CONFIG_FILE.open('r') as f:
-            return json.load(f)
+        return _load_config_cached(os.stat(CONFIG_FILE_STR).st_mtime_ns)
     except json.JSONDecodeError as e:
-        logging.error(f"Error parsing configuration file: {e}")
-        sys.exit(1)
+        raise GigarandrError(f"Error parsing configuration file: {e}")
     except FileNotFoundError:
-        logging.error("Configuration file not found.")
-        sys.exit(1)
+        raise GigarandrError("Configuration file not found.")
 
 
 def load_state() -> Dict[str, Any]:
     """Load the saved monitor state."""
     try:
-        with STATE_FILE.open('r') as f:
-            return json.load(f)
+        with open(STATE_FILE_STR, 'rb') as f:
+            return _json_loads(f.read())
     except json.JSONDecodeError as e:
         logging.error(f"Error parsing state file: {e}")
         return {}
@@ -81,158 +156,549 @@ def load_state() -> Dict[str, Any]:
 
 
 def save_state(state: Dict[str, Any]) -> None:
-    """Save the monitor state to a file."""
+    """Save the monitor state to a file, replacing it atomically."""
+    tmp_file = STATE_FILE_STR + '.tmp'
     try:
-        with STATE_FILE.open('w') as f:
-            json.dump(state, f, indent=4)
+        with open(tmp_file, 'wb') as f:
+            # The state file is only read by gigarandr, so skip pretty-printing
+            f.write(_json_dumps(state, indent=False))
+        os.replace(tmp_file, STATE_FILE_STR)
     except Exception as e:
         logging.error(f"Error saving state file: {e}")
 
 
-def run_hook(hooks: Dict[str, List[str]], stage: str) -> None:
-    """Run hook commands for a given stage."""
+def _split_hook_command(command: str) -> Optional[List[str]]:
+    """
+    Split a hook command into an argv list if it can run without a shell.
+
+    Args:
+        command: The hook command as written in the configuration.
+
+    Returns:
+        The argv list, or None if the command needs `/bin/sh` to run.
+    """
+    if any(c in command for c in SHELL_METACHARACTERS):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    # Variable assignments and shell builtins still need a shell
+    if not argv or '=' in argv[0] or shutil.which(argv[0]) is None:
+        return None
+    return argv
+
+
+def prepare_hooks(hooks: Dict[str, List[str]]) -> Dict[str, List[HookCommand]]:
+    """
+    Pre-split hook commands once, when the configuration is loaded.
+
+    Args:
+        hooks: Hook commands from the configuration, keyed by stage.
+
+    Returns:
+        For each stage, a list of (command, argv) tuples where argv is None
+        for commands that must run through the shell.
+    """
+    return {
+        stage: [(command, _split_hook_command(command)) for command in commands]
+        for stage, commands in hooks.items()
+    }
+
+
+def _fast_spawn(argv: List[str]) -> int:
+    """Spawn argv with os.posix_spawnp, wait for it, and return its exit code."""
+    # Restore the signals Python ignores, as subprocess does with restore_signals
+    pid = os.posix_spawnp(argv[0], argv, os.environ, setsigdef=_RESTORED_SIGNALS)
+    return os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+
+
+def _run_hook_command(command: str, argv: Optional[List[str]]) -> subprocess.CompletedProcess:
+    """Run a single hook command, directly if it was pre-split or through the shell."""
+    if argv is not None:
+        if not hasattr(os, 'posix_spawnp'):
+            return subprocess.run(argv, check=True)
+        returncode = _fast_spawn(argv)
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, argv)
+        return subprocess.CompletedProcess(argv, returncode)
+    return subprocess.run(command, shell=True, check=True)
+
+
+def _report_hook_result(command: str, get_result: Callable[[], subprocess.CompletedProcess]) -> None:
+    """Wait for a hook command's result via get_result and log its outcome."""
+    try:
+        result = get_result()
+        logging.debug(f"Command output: {result.stdout}")
+    except subprocess.CalledProcessError as e:
+        logging.error(f"Command failed: {command}\nError: {e}")
+    except Exception as e:
+        logging.error(f"An error occurred while running command: {command}\nError: {e}")
+
+
+def run_hook(hooks: Dict[str, List[HookCommand]], stage: str, parallel: bool = False) -> None:
+    """
+    Run hook commands for a given stage.
+
+    Args:
+        hooks: Prepared hook commands, as returned by `prepare_hooks`.
+        stage: The stage to run hooks for.
+        parallel: Run the stage's commands concurrently instead of one after another.
+    """
     commands = hooks.get(stage, [])
-    for command in commands:
+    if parallel and len(commands) > 1:
+        for command, _ in commands:
+            logging.info(f"Running command: {command}")
+        with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+            futures = [executor.submit(_run_hook_command, command, argv) for command, argv in commands]
+        # Report results in configuration order once every command has finished
+        for (command, _), future in zip(commands, futures):
+            _report_hook_result(command, future.result)
+        return
+
+    for command, argv in commands:
         logging.info(f"Running command: {command}")
+        _report_hook_result(command, partial(_run_hook_command, command, argv))
+
+
+def query_xrandr() -> Dict[str, Dict[str, Any]]:
+    """
+    Run `xrandr --query` and parse its output.
+
+    The output is parsed line by line as `xrandr` writes it, rather than
+    buffered in full first.
+
+    Returns:
+        A dictionary keyed by output name, as returned by `parse_xrandr_output`.
+
+    Raises:
+        GigarandrError: If `xrandr` cannot be run or fails.
+    """
+    try:
+        with subprocess.Popen(['xrandr', '--query'], stdout=subprocess.PIPE) as process:
+            outputs = parse_xrandr_output(process.stdout)
+    except OSError as e:
+        raise GigarandrError(f"Error running xrandr: {e}")
+    if process.returncode:
+        raise GigarandrError(f"Error running xrandr: exit status {process.returncode}")
+    return outputs
+
+
+def _parse_mode_line(line: bytes) -> Optional[Tuple[str, List[float]]]:
+    """
+    Parse an indented mode line such as `   1920x1080     60.00*+  59.94`.
+
+    Args:
+        line: A mode line from `xrandr --query`.
+
+    Returns:
+        A (resolution, refresh rates) tuple, or None if the line is not a mode line.
+    """
+    parts = line.split()
+    if not parts or b'x' not in parts[0]:
+        return None
+    rates = []
+    for token in parts[1:]:
+        # Current and preferred markers may be attached or stand alone
+        token = token.rstrip(b'*+')
+        if not token:
+            continue
         try:
-            result = subprocess.run(command, shell=True, check=True)
-            logging.debug(f"Command output: {result.stdout}")
-        except subprocess.CalledProcessError as e:
-            logging.error(f"Command failed: {command}\nError: {e}")
-        except Exception as e:
-            logging.error(f"An error occurred while running command: {command}\nError: {e}")
+            rates.append(float(token))
+        except ValueError:
+            continue
+    return parts[0].decode('utf-8', errors='replace'), rates
+
+
+def _marked_rate(line: bytes, marker: bytes) -> Optional[float]:
+    """
+    Return the refresh rate carrying a marker on a mode line, if any.
+
+    Args:
+        line: A mode line from `xrandr --query`.
+        marker: `*` for the current rate or `+` for the preferred rate.
+
+    Returns:
+        The marked refresh rate, or None if no rate carries the marker.
+    """
+    parts = line.split()
+    for i in range(1, len(parts)):
+        if marker in parts[i]:
+            # A standalone marker refers to the rate before it
+            token = parts[i].rstrip(b'*+') or parts[i - 1].rstrip(b'*+')
+            try:
+                return float(token)
+            except ValueError:
+                return None
+    return None
+
+
+def parse_xrandr_output(lines: Iterable[bytes]) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse `xrandr --query` output in a single pass.
+
+    Args:
+        lines: The lines of `xrandr --query` output, e.g. its stdout pipe.
+
+    Returns:
+        A dictionary keyed by output name, containing whether the output is
+        connected and primary, its current geometry, the modes it supports as
+        (resolution, refresh rates) tuples, its preferred resolution and
+        refresh rate, and its current mode and refresh rate.
+    """
+    outputs: Dict[str, Dict[str, Any]] = {}
+    current = None
+
+    for line in lines:
+        line = line.rstrip(b'\n')
+        if not line:
+            continue
+        if line[:1].isspace():
+            # Mode lines belong to the most recent connected output
+            if current is None:
+                continue
+            mode = _parse_mode_line(line)
+            if mode:
+                current["modes"].append(mode)
+                if current["preferred"] is None and b'+' in line:
+                    current["preferred"] = mode[0]
+                    current["preferred_rate"] = _marked_rate(line, b'+')
+                if b'*' in line:
+                    current["current"] = mode[0]
+                    current["rate"] = _marked_rate(line, b'*')
+            continue
+
+        current = None
+        # Output lines start with `NAME connected` or `NAME disconnected`
+        head, sep, _ = line.partition(b' connected')
+        connected = bool(sep)
+        if not connected:
+            head, sep, _ = line.partition(b' disconnected')
+            if not sep:
+                continue
+        name = head.decode('utf-8', errors='replace')
+        width = height = x = y = None
+        geometry = _GEOMETRY_RE.search(line)
+        if geometry:
+            width, height, x, y = (int(group) for group in geometry.groups())
+        outputs[name] = {
+            "connected": connected,
+            "primary": b' primary ' in line,
+            "width": width,
+            "height": height,
+            "x": x,
+            "y": y,
+            "modes": [],
+            "preferred": None,
+            "preferred_rate": None,
+            "current": None,
+            "rate": None
+        }
+        if connected:
+            current = outputs[name]
+
+    return outputs
 
 
-def get_connected_monitors() -> List[Dict[str, Optional[int]]]:
+def get_monitor_capabilities() -> Dict[str, Dict[str, Any]]:
     """
-    Use `xrandr` to get the currently connected monitors.
+    Get the capabilities of every output reported by `xrandr`.
+
+    Query once per sync and pass the result on, rather than calling this again.
+
+    Returns:
+        A dictionary keyed by output name, as returned by `parse_xrandr_output`.
+    """
+    return query_xrandr()
+
+
+def _parse_resolution(resolution: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """Split a mode name such as `1920x1080` or `1920x1080i` into width and height."""
+    match = _RESOLUTION_RE.match(resolution or '')
+    if not match:
+        return None, None
+    return int(match.group(1)), int(match.group(2))
+
+
+def get_connected_monitors(capabilities: Dict[str, Dict[str, Any]]) -> List[Dict[str, Optional[int]]]:
+    """
+    Get the currently connected monitors.
+
+    Monitors that are connected but not yet enabled have no current geometry;
+    their preferred mode is used as their resolution instead.
+
+    Args:
+        capabilities: Output capabilities as returned by `get_monitor_capabilities`.
 
     Returns:
         A list of dictionaries containing monitor names and their resolutions.
     """
-    try:
-        output = subprocess.check_output(['xrandr', '--query'], encoding='utf-8')
-    except subprocess.CalledProcessError as e:
-        logging.error(f"Error running xrandr: {e}")
-        sys.exit(1)
     monitors = []
+    for name, info in capabilities.items():
+        if not info["connected"]:
+            continue
+        width, height = info["width"], info["height"]
+        if not (width and height):
+            width, height = _parse_resolution(info["preferred"])
+        monitors.append({
+            "name": name,
+            "width": width,
+            "height": height
+        })
+    return monitors
 
-    for line in output.splitlines():
-        if " connected" in line:
-            parts = line.split()
-            name = parts[0]
-            resolution = None
-            for part in parts:
-                if 'x' in part and ('+' in part or part.count('x') == 1):
-                    resolution_candidate = part.split('+')[0]
-                    if 'x' in resolution_candidate:
-                        resolution = resolution_candidate
-                        break
-            if resolution:
-                try:
-                    width_str, height_str = resolution.split('x')
-                    width = int(width_str)
-                    height = int(height_str)
-                except ValueError:
-                    width = height = None
-            else:
-                width = height = None
-            monitors.append({
-                "name": name,
-                "width": width,
-                "height": height
-            })
 
-    return monitors
+def is_laptop(name: str) -> bool:
+    """Return whether an output name looks like a built-in laptop panel."""
+    return name.startswith(_LAPTOP_PREFIXES)
 
 
-def resolve_monitor_keyword(monitors: List[Dict[str, Optional[int]]], keyword: str) -> Optional[str]:
+def index_monitors(monitors: List[Dict[str, Optional[int]]]) -> Dict[str, Any]:
+    """
+    Precompute everything keyword resolution needs from the connected monitors.
+
+    Args:
+        monitors: List of connected monitors with their properties.
+
+    Returns:
+        A dictionary with the set of monitor `names`, the monitor each fixed
+        keyword resolves to under `keywords`, and the ordered `external` monitor names.
+    """
+    by_area = sorted(
+        (m for m in monitors if m["width"] and m["height"]),
+        key=lambda m: m["width"] * m["height"]
+    )
+    areas = [m["width"] * m["height"] for m in by_area]
+    laptop = next((m["name"] for m in monitors if is_laptop(m["name"])), None)
+    external = [m["name"] for m in monitors if not is_laptop(m["name"])]
+    return {
+        "names": {m["name"] for m in monitors},
+        "keywords": {
+            "laptop": laptop,
+            # The sort is stable, so ties keep the first connected monitor
+            "largest": by_area[bisect_left(areas, areas[-1])]["name"] if by_area else None,
+            "smallest": by_area[0]["name"] if by_area else None,
+        },
+        "external": external,
+    }
+
+
+def resolve_monitor_keyword(
+    monitors: List[Dict[str, Optional[int]]],
+    keyword: str,
+    index: Optional[Dict[str, Any]] = None
+) -> Optional[str]:
     """
     Resolve a keyword like 'largest', 'smallest', 'laptop', or 'external-N' to an actual monitor name.
 
     Args:
         monitors: List of connected monitors with their properties.
         keyword: The keyword to resolve.
+        index: Precomputed lookups from `index_monitors`; built from `monitors` if omitted.
 
     Returns:
         The resolved monitor name or None if it cannot be resolved.
     """
-    if keyword == "laptop":
-        for monitor in monitors:
-            if "eDP" in monitor["name"] or "LVDS" in monitor["name"]:  # Likely laptop monitor
-                return monitor["name"]
-    elif keyword == "largest":
-        monitors_with_size = [m for m in monitors if m["width"] and m["height"]]
-        if monitors_with_size:
-            return max(monitors_with_size, key=lambda m: m["width"] * m["height"])["name"]
-        else:
-            logging.warning("No monitors with size information found for 'largest' keyword.")
-    elif keyword == "smallest":
-        monitors_with_size = [m for m in monitors if m["width"] and m["height"]]
-        if monitors_with_size:
-            return min(monitors_with_size, key=lambda m: m["width"] * m["height"])["name"]
-        else:
-            logging.warning("No monitors with size information found for 'smallest' keyword.")
+    if index is None:
+        index = index_monitors(monitors)
+    if keyword in index["keywords"]:
+        name = index["keywords"][keyword]
+        if name is None and keyword in ("largest", "smallest"):
+            logging.warning(f"No monitors with size information found for '{keyword}' keyword.")
+        return name
     elif keyword.startswith("external-"):
         external_number_str = keyword.split("-", 1)[1]
         try:
             external_number = int(external_number_str)
-            external_monitors = [
-                m for m in monitors
-                if not ("eDP" in m["name"] or "LVDS" in m["name"])
-            ]
+            external_monitors = index["external"]
             if 0 < external_number <= len(external_monitors):
-                return external_monitors[external_number - 1]["name"]
+                return external_monitors[external_number - 1]
             else:
                 logging.warning(f"External monitor {external_number} not found.")
         except ValueError:
             logging.error(f"Invalid external monitor number: {external_number_str}")
     else:
         # Check if the keyword matches a monitor name directly
-        if any(m["name"] == keyword for m in monitors):
+        if keyword in index["names"]:
             return keyword
         else:
             logging.warning(f"Monitor '{keyword}' not found among connected monitors.")
     return None  # Return None if no monitor could be resolved
 
 
-def manage_monitors(monitors: List[Dict[str, Optional[int]]], config: Dict[str, Any]) -> None:
+def _expected_position(
+    position: str,
+    info: Dict[str, Any],
+    ref: Dict[str, Any]
+) -> Optional[Tuple[int, int]]:
+    """
+    Compute where xrandr places an output relative to a reference output.
+
+    Args:
+        position: The xrandr position option without dashes, e.g. 'below'.
+        info: The output being positioned, as returned by `parse_xrandr_output`.
+        ref: The reference output, as returned by `parse_xrandr_output`.
+
+    Returns:
+        The expected (x, y) of the output, or None for an unknown position.
+    """
+    if position == "left-of":
+        return ref["x"] - info["width"], ref["y"]
+    elif position == "right-of":
+        return ref["x"] + ref["width"], ref["y"]
+    elif position == "above":
+        return ref["x"], ref["y"] - info["height"]
+    elif position == "below":
+        return ref["x"], ref["y"] + ref["height"]
+    elif position == "same-as":
+        return ref["x"], ref["y"]
+    return None
+
+
+def _output_matches(
+    capabilities: Dict[str, Dict[str, Any]],
+    name: str,
+    primary: bool,
+    position: Optional[str],
+    ref_name: Optional[str],
+    refresh_rate: Optional[float]
+) -> bool:
+    """
+    Check whether an output's current state already matches its configuration.
+
+    Args:
+        capabilities: Output capabilities as returned by `get_monitor_capabilities`.
+        name: The output to check.
+        primary: Whether the output should be primary.
+        position: The xrandr position option without dashes, if any.
+        ref_name: The output the position is relative to, if any.
+        refresh_rate: The requested refresh rate, if any.
+
+    Returns:
+        True if applying the configuration would not change the output.
+    """
+    info = capabilities.get(name)
+    if not info or info["x"] is None:
+        return False  # Output is not active
+    auto_mode = info["preferred"] or (info["modes"][0][0] if info["modes"] else None)
+    if info["current"] != auto_mode:
+        return False
+    if primary and not info["primary"]:
+        return False
+    if refresh_rate is None:
+        # Without a configured rate, --auto switches to the preferred rate
+        expected_rate = info["preferred_rate"] if info["preferred"] else None
+    else:
+        # --rate picks the closest rate the resolution offers
+        rates = [rate for mode, mode_rates in info["modes"] if mode == auto_mode for rate in mode_rates]
+        expected_rate = min(rates, key=lambda rate: abs(rate - refresh_rate)) if rates else refresh_rate
+    if expected_rate is not None and (
+        info["rate"] is None or abs(info["rate"] - expected_rate) > _RATE_TOLERANCE
+    ):
+        return False
+    if position:
+        ref = capabilities.get(ref_name)
+        if not ref or ref["x"] is None:
+            return False
+        if _expected_position(position, info, ref) != (info["x"], info["y"]):
+            return False
+    return True
+
+
+def manage_monitors(
+    monitors: List[Dict[str, Optional[int]]],
+    capabilities: Dict[str, Dict[str, Any]],
+    config: Dict[str, Any],
+    force: bool = False
+) -> bool:
     """
     Use `xrandr` to apply the configuration from the JSON file to the monitors.
 
+    All configuration is applied with a single `xrandr` invocation; monitor
+    capabilities come from the sync's single query rather than spawning `xrandr` again.
+    Outputs whose current state already matches the configuration are left out
+    of the invocation, and `xrandr` is not run at all if nothing would change.
+
     Args:
         monitors: List of connected monitors with their properties.
+        capabilities: Output capabilities as returned by `get_monitor_capabilities`.
         config: The configuration dictionary.
+        force: Apply the configuration to every output even if it already matches.
+
+    Returns:
+        True if `xrandr` was run to change the configuration.
+
+    Raises:
+        GigarandrError: If the `xrandr` command fails.
     """
-    commands = ['xrandr']
     monitor_configs = config.get("monitors", [])
+    # Keywords such as "largest" are typically referenced several times; resolve each once
+    resolve = lru_cache(maxsize=None)(
+        partial(resolve_monitor_keyword, monitors, index=index_monitors(monitors))
+    )
+    # (output name, xrandr arguments, reference output, already matches)
+    outputs: List[Tuple[str, List[str], Optional[str], bool]] = []
 
     for monitor_config in monitor_configs:
         keyword_name = monitor_config["name"]
-        name = resolve_monitor_keyword(monitors, keyword_name)
+        name = resolve(keyword_name)
         if not name:
             logging.warning(f"Monitor '{keyword_name}' could not be resolved. Skipping.")
             continue  # Skip configuration for monitors not resolved
-        commands += ["--output", name, "--auto"]
-        if monitor_config.get("primary", False):
-            commands += ["--primary"]
+        args = ["--output", name, "--auto"]
+        primary = monitor_config.get("primary", False)
+        if primary:
+            args += ["--primary"]
+        position_keyword = ref_name = target_rate = None
         position = monitor_config.get("position")
         if position:
             if " " in position:
                 position_keyword, ref_monitor_keyword = position.split(" ", 1)
-                ref_name = resolve_monitor_keyword(monitors, ref_monitor_keyword)
+                ref_name = resolve(ref_monitor_keyword)
                 if not ref_name:
                     logging.warning(
                         f"Reference monitor '{ref_monitor_keyword}' could not be resolved. "
                         f"Skipping position setting for '{name}'."
                     )
+                    outputs.append((name, args, None, False))
                     continue
-                commands += [f"--{position_keyword}", ref_name]
+                if ref_name == name:
+                    # E.g. "laptop below largest" with only the laptop connected
+                    logging.debug(f"Ignoring position of '{name}' relative to itself.")
+                    position_keyword = ref_name = None
+                else:
+                    args += [f"--{position_keyword}", ref_name]
             else:
                 logging.warning(f"Invalid position format: '{position}'")
         refresh_rate = monitor_config.get("refresh_rate")
+        rate_valid = True
         if refresh_rate:
-            commands += ["--rate", str(refresh_rate)]
+            args += ["--rate", str(refresh_rate)]
+            try:
+                target_rate = float(refresh_rate)
+            except (TypeError, ValueError):
+                rate_valid = False  # Leave it to xrandr to report the invalid rate
+        matches = not force and rate_valid and _output_matches(
+            capabilities, name, primary, position_keyword, ref_name, target_rate
+        )
+        outputs.append((name, args, ref_name, matches))
+
+    # Outputs positioned relative to a reconfigured output must be reapplied too
+    changed = {name for name, _, _, matches in outputs if not matches}
+    grew = True
+    while grew:
+        grew = False
+        for name, _, ref_name, _ in outputs:
+            if name not in changed and ref_name in changed:
+                changed.add(name)
+                grew = True
+
+    commands = ['xrandr']
+    for name, args, _, _ in outputs:
+        if name in changed:
+            commands += args
+        else:
+            logging.debug(f"Monitor '{name}' already matches the configuration. Skipping.")
 
     if len(commands) > 1:
         logging.info(f"Executing: {' '.join(commands)}")
@@ -248,37 +714,156 @@ def manage_monitors(monitors: List[Dict[str, Optional[int]]], config: Dict[str,
             if result.stderr:
                 logging.warning(f"xrandr warnings: {result.stderr}")
         except subprocess.CalledProcessError as e:
-            logging.error(f"Error executing xrandr command: {e.stderr}")
-            sys.exit(1)
+            raise GigarandrError(f"Error executing xrandr command: {e.stderr.strip()}")
+        except OSError as e:
+            raise GigarandrError(f"Error executing xrandr command: {e}")
+        return True
+    elif outputs:
+        logging.info("Monitors already match the configuration. Nothing to apply.")
     else:
         logging.warning("No monitor configurations to apply.")
+    return False
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Manage monitor configurations using xrandr.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="reconfigure every monitor even if it already matches the configuration"
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep running and reconfigure monitors whenever they change (requires pyudev)"
+    )
+    return parser.parse_args()
+
+
+def sync_monitors(
+    config: Dict[str, Any],
+    hooks: Dict[str, List[HookCommand]],
+    state: Dict[str, Any],
+    force: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Run the presync, sync and postsync phases once.
 
+    Args:
+        config: The configuration dictionary.
+        hooks: Prepared hook commands, as returned by `prepare_hooks`.
+        state: The monitor state saved by the previous sync.
+        force: Reconfigure every monitor even if it already matches the configuration.
 
-def main() -> None:
-    """Main function to manage monitor configurations."""
-    ensure_config_directory()
-    config = load_config()
-    state = load_state()
-    hooks = config.get('hooks', {})
+    Returns:
+        The new monitor state, or None if no monitors were detected.
+    """
+    parallel_hooks = config.get('parallel_hooks', False)
 
     # PreSync Phase
-    run_hook(hooks, 'presync')
+    run_hook(hooks, 'presync', parallel_hooks)
 
     # Monitor management (Sync Phase)
-    monitors = get_connected_monitors()
+    capabilities = get_monitor_capabilities()
+    monitors = get_connected_monitors(capabilities)
     if not monitors:
-        logging.error("No monitors detected. Exiting.")
-        sys.exit(1)
-    manage_monitors(monitors, config)
+        logging.error("No monitors detected.")
+        return None
+    # The live xrandr state decides what to apply; sync hooks only run after a change
+    if manage_monitors(monitors, capabilities, config, force):
+        run_hook(hooks, 'sync', parallel_hooks)
 
-    run_hook(hooks, 'sync')
+    new_state = {monitor["name"]: True for monitor in monitors}
 
-    # Save the new monitor state
-    save_state({monitor["name"]: True for monitor in monitors})
+    # Save the new monitor state, skipping the write when nothing changed
+    if new_state != state:
+        save_state(new_state)
+    else:
+        logging.debug("Monitor state unchanged. Not rewriting state file.")
 
     # PostSync Phase
-    run_hook(hooks, 'postsync')
+    run_hook(hooks, 'postsync', parallel_hooks)
+    return new_state
+
+
+def run_daemon(state: Dict[str, Any], force: bool = False) -> None:
+    """
+    Sync monitors now and again on every DRM change reported by udev.
+
+    The configuration is checked on each change but only re-read and its
+    hooks re-split when `config.json` has been modified. A failed sync is
+    logged and the daemon keeps waiting for the next change.
+
+    Args:
+        state: The monitor state saved by the previous run.
+        force: Reconfigure every monitor on the initial sync even if it already matches.
+    """
+    try:
+        import pyudev
+    except ImportError:
+        logging.error("Daemon mode requires the pyudev package.")
+        sys.exit(1)
+
+    context = pyudev.Context()
+    udev_monitor = pyudev.Monitor.from_netlink(context)
+    udev_monitor.filter_by('drm')
+    udev_monitor.start()
+
+    config: Optional[Dict[str, Any]] = None
+    hooks: Dict[str, List[HookCommand]] = {}
+
+    def handle_change(force_sync: bool = False) -> None:
+        nonlocal config, hooks, state
+        try:
+            latest_config = load_config()
+            if latest_config is not config:
+                config = latest_config
+                hooks = prepare_hooks(config.get('hooks', {}))
+            new_state = sync_monitors(config, hooks, state, force_sync)
+        except GigarandrError as e:
+            logging.error(e)
+            logging.info("Waiting for the next change.")
+            return
+        except Exception:
+            logging.exception("Monitor sync failed. Waiting for the next change.")
+            return
+        if new_state is not None:
+            state = new_state
+
+    handle_change(force)
+    logging.info("Watching for monitor changes.")
+    try:
+        for device in iter(udev_monitor.poll, None):
+            # Connector changes arrive in bursts; wait for them to settle
+            while udev_monitor.poll(timeout=DAEMON_SETTLE_SECONDS) is not None:
+                pass
+            logging.info(f"Monitor change detected on {device.sys_name}.")
+            handle_change()
+    except KeyboardInterrupt:
+        logging.info("Stopping.")
+
+
+def main() -> None:
+    """Main function to manage monitor configurations."""
+    args = parse_args()
+    ensure_config_directory()
+    state = load_state()
+
+    if args.daemon:
+        run_daemon(state, args.force)
+        return
+
+    try:
+        config = load_config()
+        hooks = prepare_hooks(config.get('hooks', {}))
+        new_state = sync_monitors(config, hooks, state, args.force)
+    except GigarandrError as e:
+        logging.error(e)
+        sys.exit(1)
+    if new_state is None:
+        sys.exit(1)
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()